@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+import uuid
+from typing import List, Optional, Sequence, Tuple
+
+from .proceso import Proceso
+from .simulador import POLITICA, VERSION_MOTOR, Simulador
+
+
+Carga = Sequence[Tuple[int, int]]  # (memoria_mb, duracion_s) por proceso, en orden de llegada
+
+# Versión del generador de carga_aleatoria(). Subirla si cambian sus rangos o su
+# algoritmo: forma parte de la clave de las corridas por semilla.
+VERSION_CARGA = "1"
+
+
+class CacheError(Exception):
+    """Errores del cache de resultados."""
+
+
+def carga_aleatoria(semilla: int, cantidad: int) -> List[Tuple[int, int]]:
+    """Carga reproducible con los mismos rangos que 'Agregar aleatorio' de la GUI."""
+    rnd = random.Random(semilla)
+    return [(rnd.randint(20, 1000), rnd.randint(3, 15)) for _ in range(cantidad)]
+
+
+def correr(capacidad_mb: int, carga: Carga, directorio_trazas: Optional[str] = None) -> dict:
+    """
+    Corre la simulación completa de 'carga' (todo llega en t=0) y devuelve métricas resumen.
+    Los procesos se identifican por su índice en la carga: los PID dependen del proceso
+    Python que corre y no sirven para comparar corridas.
+    """
+    if any(m > capacidad_mb for m, _ in carga):
+        # El simulador esperaría para siempre a que quepa: mejor fallar aquí.
+        raise CacheError("La carga tiene procesos que no caben en la capacidad de RAM.")
+
+    registro = None
+    if directorio_trazas is not None:
+        from .series import RegistroSeries  # numpy solo hace falta si se piden trazas
+        registro = RegistroSeries(directorio_trazas)
+
+    sim = Simulador(capacidad_mb=capacidad_mb, registro=registro)
+    procesos = [Proceso(f"P{i}", memoria_mb=m, duracion_s=d) for i, (m, d) in enumerate(carga)]
+    indice = {p.pid: i for i, p in enumerate(procesos)}
+    sim.cargar(procesos)
+
+    fin_tick: List[int] = [0] * len(procesos)
+    vistos = 0
+    while sim.corriendo():
+        sim.paso()
+        if len(sim.finalizados) > vistos:
+            for p in sim.finalizados[vistos:]:
+                fin_tick[indice[p.pid]] = sim.cpu.tiempo_total
+            vistos = len(sim.finalizados)
+    if registro is not None:
+        registro.cerrar()
+
+    return {
+        "ticks": sim.cpu.tiempo_total,
+        "completados": len(sim.finalizados),
+        "pico_mb": sim.memoria.pico_mb,
+        "promedio_mb": sim.memoria.promedio_mb,
+        "retorno_promedio_s": sum(fin_tick) / len(fin_tick) if fin_tick else 0.0,
+        "orden_finalizacion": [indice[p.pid] for p in sim.finalizados],
+        "fin_tick": fin_tick,
+    }
+
+
+class CacheResultados:
+    """
+    Cache en disco de corridas completas, direccionado por contenido.
+
+    - Clave: SHA-256 de (capacidad, política, versión del motor, carga o semilla).
+    - Cada entrada es una carpeta <dir>/<ab>/<clave>/ con 'resumen.json' y, si se
+      pidieron, las trazas de series.RegistroSeries.
+    - Escritura segura entre procesos: la entrada se arma en una carpeta temporal y
+      se publica con un rename atómico; si otro worker ganó, se descarta la propia
+      (una entrada con trazas nunca se reemplaza por una sin trazas).
+    - LRU por tamaño: cada acierto toca el mtime del resumen; al pasar 'max_bytes'
+      se borran las entradas menos usadas (primero se renombran, luego se eliminan).
+      Las usadas hace menos de 'gracia_s' segundos no se podan: así otro worker no
+      borra una entrada recién publicada o unas trazas que alguien está leyendo.
+    - Restos de workers caídos: las carpetas '.del-*' se borran siempre y las
+      '.tmp-*' cuando superan 'edad_restos_s' (más que la corrida más larga).
+    """
+
+    RESUMEN = "resumen.json"
+
+    def __init__(self, directorio: str, max_bytes: int = 256 * 1024 * 1024,
+                 gracia_s: float = 60.0, edad_restos_s: float = 6 * 3600) -> None:
+        if max_bytes <= 0:
+            raise CacheError("'max_bytes' debe ser > 0.")
+        self.directorio = directorio
+        self.max_bytes = max_bytes
+        self.gracia_s = gracia_s
+        self.edad_restos_s = edad_restos_s
+        os.makedirs(directorio, exist_ok=True)
+
+    # --------------- Claves ---------------
+
+    @staticmethod
+    def clave(capacidad_mb: int, carga: Optional[Carga] = None,
+              semilla: Optional[int] = None, cantidad: Optional[int] = None) -> str:
+        """Clave por contenido de la carga, o por (semilla, cantidad) si es aleatoria."""
+        if (carga is None) == (semilla is None):
+            raise CacheError("Indique la carga o la semilla (una de las dos).")
+        if semilla is not None and (cantidad is None or cantidad <= 0):
+            raise CacheError("Con 'semilla' hay que indicar una 'cantidad' de procesos > 0.")
+        datos = {
+            "capacidad_mb": capacidad_mb,
+            "politica": POLITICA,
+            "motor": VERSION_MOTOR,
+        }
+        if carga is not None:
+            datos["carga"] = [[int(m), int(d)] for m, d in carga]
+        else:
+            datos["semilla"] = [semilla, cantidad, VERSION_CARGA]
+        texto = json.dumps(datos, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+    def _ruta(self, clave: str) -> str:
+        return os.path.join(self.directorio, clave[:2], clave)
+
+    # --------------- Lectura / escritura ---------------
+
+    def obtener(self, clave: str) -> Optional[dict]:
+        """
+        Resumen guardado (con 'trazas' = carpeta o None), o None si no está.
+        La carpeta de trazas no se poda durante al menos 'gracia_s' segundos.
+        """
+        ruta = self._ruta(clave)
+        archivo = os.path.join(ruta, self.RESUMEN)
+        try:
+            with open(archivo, encoding="utf-8") as f:
+                resumen = json.load(f)
+            os.utime(archivo)  # marca de uso para el LRU
+        except (OSError, ValueError):
+            return None  # ausente, a medio borrar o corrupto: se trata como fallo
+        resumen["trazas"] = ruta if resumen.pop("_con_trazas", False) else None
+        return resumen
+
+    def ejecutar(self, capacidad_mb: int, carga: Optional[Carga] = None,
+                 semilla: Optional[int] = None, cantidad: Optional[int] = None,
+                 trazas: bool = False) -> dict:
+        """
+        Devuelve el resumen de la corrida, desde el cache si existe.
+        Con trazas=True se exige una entrada que tenga las series guardadas
+        (la carpeta devuelta no se poda durante al menos 'gracia_s' segundos).
+        """
+        clave = self.clave(capacidad_mb, carga, semilla, cantidad)
+        resumen = self.obtener(clave)
+        if resumen is not None and (resumen["trazas"] or not trazas):
+            return resumen
+
+        if carga is None:
+            carga = carga_aleatoria(semilla, cantidad)  # type: ignore[arg-type]
+        os.makedirs(os.path.join(self.directorio, clave[:2]), exist_ok=True)
+        tmp = tempfile.mkdtemp(prefix=".tmp-", dir=os.path.join(self.directorio, clave[:2]))
+        try:
+            resumen = correr(capacidad_mb, carga, directorio_trazas=tmp if trazas else None)
+            resumen["_con_trazas"] = trazas
+            with open(os.path.join(tmp, self.RESUMEN), "w", encoding="utf-8") as f:
+                json.dump(resumen, f)
+            publicada = self._publicar(tmp, self._ruta(clave), trazas)
+        finally:
+            if os.path.isdir(tmp):
+                shutil.rmtree(tmp, ignore_errors=True)
+
+        if trazas and not publicada:
+            # Nunca devolvemos "sin trazas" a quien las pidió.
+            raise CacheError(f"No se pudo publicar la entrada con trazas de {clave}.")
+        self.podar(conservar=clave)
+        # Devolvemos lo calculado: releer la entrada podría fallar si otro worker la poda.
+        resumen.pop("_con_trazas")
+        resumen["trazas"] = self._ruta(clave) if trazas else None
+        return resumen
+
+    def _con_trazas(self, ruta: str) -> Optional[bool]:
+        """¿La entrada publicada en 'ruta' tiene trazas? None si no hay entrada legible."""
+        try:
+            with open(os.path.join(ruta, self.RESUMEN), encoding="utf-8") as f:
+                return bool(json.load(f).get("_con_trazas", False))
+        except (OSError, ValueError):
+            return None
+
+    def _publicar(self, tmp: str, destino: str, trazas: bool, intentos: int = 10) -> bool:
+        """
+        Publica 'tmp' en 'destino'. Si ya hay una entrada, solo se reemplaza cuando la
+        nueva trae trazas y la existente no; en cualquier otro caso vale la existente.
+        Devuelve True si 'destino' quedó con la nuestra o con una igual o mejor.
+        """
+        for _ in range(intentos):
+            existente = self._con_trazas(destino)
+            if existente is not None and (existente or not trazas):
+                os.utime(os.path.join(destino, self.RESUMEN))  # recién usada: en gracia
+                return True  # otro worker publicó una entrada igual o mejor
+            if os.path.isdir(destino):
+                self._retirar(destino)  # sin trazas (o ilegible) y la nuestra es válida
+            try:
+                os.rename(tmp, destino)
+                return True
+            except OSError:
+                continue  # otro worker publicó justo antes: volvemos a comparar
+        return False
+
+    def _retirar(self, ruta: str) -> None:
+        """Saca una entrada con un rename atómico y luego la borra sin apuro."""
+        basura = os.path.join(os.path.dirname(ruta), f".del-{uuid.uuid4().hex}")
+        try:
+            os.rename(ruta, basura)
+        except OSError:
+            return  # otro worker ya la retiró
+        shutil.rmtree(basura, ignore_errors=True)
+
+    # --------------- Tamaño y LRU ---------------
+
+    def _entradas(self) -> List[Tuple[float, int, str]]:
+        """(último uso, bytes, ruta) de cada entrada publicada."""
+        entradas = []
+        for sub in os.listdir(self.directorio):
+            carpeta = os.path.join(self.directorio, sub)
+            if not os.path.isdir(carpeta):
+                continue
+            for nombre in os.listdir(carpeta):
+                if nombre.startswith("."):
+                    continue  # temporales o en borrado
+                ruta = os.path.join(carpeta, nombre)
+                try:
+                    uso = os.path.getmtime(os.path.join(ruta, self.RESUMEN))
+                    tam = sum(e.stat().st_size for e in os.scandir(ruta) if e.is_file())
+                except OSError:
+                    continue
+                entradas.append((uso, tam, ruta))
+        return entradas
+
+    def tamano_bytes(self) -> int:
+        return sum(tam for _, tam, _ in self._entradas())
+
+    def podar(self, conservar: Optional[str] = None) -> None:
+        """
+        Borra las entradas menos usadas hasta quedar por debajo de 'max_bytes'.
+        No toca las usadas hace menos de 'gracia_s', ni 'conservar' (la recién
+        escrita), aunque con ellas el total quede por encima del límite.
+        """
+        self._borrar_restos()
+        entradas = self._entradas()
+        total = sum(tam for _, tam, _ in entradas)
+        limite_uso = time.time() - self.gracia_s
+        for uso, tam, ruta in sorted(entradas):
+            if total <= self.max_bytes or uso > limite_uso:
+                break  # ordenadas por uso: de aquí en más todas están en gracia
+            if conservar is not None and os.path.basename(ruta) == conservar:
+                continue
+            self._retirar(ruta)
+            total -= tam
+
+    def limpiar(self) -> None:
+        """Vacía el cache completo (salvo temporales de corridas aún en curso)."""
+        self._borrar_restos()
+        for _, _, ruta in self._entradas():
+            self._retirar(ruta)
+
+    def _borrar_restos(self) -> None:
+        """Borra '.del-*' y los '.tmp-*' más viejos que 'edad_restos_s' (workers caídos)."""
+        limite = time.time() - self.edad_restos_s
+        for sub in os.listdir(self.directorio):
+            carpeta = os.path.join(self.directorio, sub)
+            if not os.path.isdir(carpeta):
+                continue
+            for nombre in os.listdir(carpeta):
+                ruta = os.path.join(carpeta, nombre)
+                try:
+                    viejo = os.path.getmtime(ruta) < limite
+                except OSError:
+                    continue  # otro worker lo acaba de mover o borrar
+                if nombre.startswith(".del-") or (nombre.startswith(".tmp-") and viejo):
+                    shutil.rmtree(ruta, ignore_errors=True)
+
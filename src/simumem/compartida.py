@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from itertools import islice
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .simulador import Simulador
+
+
+class CompartidaError(Exception):
+    """Errores de la foto en memoria compartida."""
+
+
+# Un registro por proceso en cola (ancho fijo).
+REGISTRO = np.dtype([("pid", np.int64), ("memoria_mb", np.int64), ("restante_s", np.int64)])
+
+# Cabecera global (int64): firma, capacidad de cada cola, último slot publicado,
+# cuadros publicados (0 = todavía nada) y hasta qué entrada se escribió cada anillo.
+_FIRMA = 0x53494D464F544F31  # "SIMFOTO1"
+_CAB_FIRMA, _CAB_MAX_COLA, _CAB_ULTIMO, _CAB_PUBLICADOS, _CAB_ESCRITO_LISTOS, _CAB_ESCRITO_ESPERA = range(6)
+_CAB_LARGO = 8
+
+# Escalares de cada slot (int64). 'seq' es el seqlock del slot: impar mientras se escribe.
+# ini_* es el número de entrada (global, monótono) del frente publicado de cada cola.
+ESCALARES = ("seq", "tick", "capacidad_mb", "usado_mb", "pico_mb",
+             "cpu_pid", "cpu_restante_s", "n_listos", "n_espera", "n_finalizados",
+             "ini_listos", "pub_listos", "ini_espera", "pub_espera")
+_I = {nombre: i for i, nombre in enumerate(ESCALARES)}
+_ESC_LARGO = 16
+
+# Colas: (atributo en el planificador, contadores de altas y bajas, índice en la cabecera,
+# sufijo de sus escalares)
+_COLAS = (
+    ("listos", "altas_listos", "bajas_listos", _CAB_ESCRITO_LISTOS, "listos"),
+    ("espera_memoria", "altas_espera", "bajas_espera", _CAB_ESCRITO_ESPERA, "espera"),
+)
+
+
+def _vistas(buf, max_cola: int):
+    """
+    Vistas NumPy sobre 'buf': cabecera, escalares de los dos slots y los dos anillos.
+    Cada anillo mide 2*max_cola y cada entrada se escribe en sus dos mitades (espejo),
+    así cualquier ventana de hasta max_cola entradas es una vista contigua.
+    """
+    cab = np.ndarray((_CAB_LARGO,), dtype=np.int64, buffer=buf)
+    base = _CAB_LARGO * 8
+    slots = []
+    for _ in range(2):
+        slots.append(np.ndarray((_ESC_LARGO,), dtype=np.int64, buffer=buf, offset=base))
+        base += _ESC_LARGO * 8
+    anillos = []
+    for _ in _COLAS:
+        anillos.append(np.ndarray((2 * max_cola,), dtype=REGISTRO, buffer=buf, offset=base))
+        base += 2 * max_cola * REGISTRO.itemsize
+    return cab, slots, anillos
+
+
+def _tam_total(max_cola: int) -> int:
+    return _CAB_LARGO * 8 + 2 * _ESC_LARGO * 8 + len(_COLAS) * 2 * max_cola * REGISTRO.itemsize
+
+
+class PublicadorFoto:
+    """
+    Lado del motor: publica el estado del simulador en un bloque de memoria compartida
+    (multiprocessing.shared_memory) para que otros procesos lo lean sin pickle ni pipes.
+
+    Colas como anillos: un proceso en cola no cambia (pid, memoria y restante solo
+    cambian en CPU), así que cada entrada se escribe una sola vez, al encolarse, y
+    por cuadro solo se publican frente/fin. Lo nuevo se detecta con los contadores
+    altas_*/bajas_* del planificador, sin recorrer las colas.
+
+    Escalares con doble buffer + seqlock por slot:
+      - Se escribe siempre el slot que NO es el último publicado; su 'seq' queda
+        impar durante la escritura y par al terminar. Luego se marca como último.
+      - Un lector usa el último slot y verifica que su 'seq' no cambió y que el
+        anillo no pisó su ventana (ver LectorFoto.vigente).
+
+    Los anillos miden 'max_cola'; si una cola es más larga se publican sus últimos
+    'max_cola' procesos (n_listos / n_espera conservan el largo real).
+    """
+
+    def __init__(self, max_cola: int = 100_000, nombre: Optional[str] = None) -> None:
+        if max_cola <= 0:
+            raise CompartidaError("'max_cola' debe ser > 0.")
+        self.max_cola = max_cola
+        self.shm = shared_memory.SharedMemory(name=nombre, create=True, size=_tam_total(max_cola))
+        self._cab, self._slots, self._anillos = _vistas(self.shm.buf, max_cola)
+        self._cab[:] = 0
+        for esc in self._slots:
+            esc[:] = 0
+        self._cab[_CAB_MAX_COLA] = max_cola
+        self._cab[_CAB_FIRMA] = _FIRMA
+        # Por cola: número global de la entrada siguiente a escribir, y desplazamiento
+        # entre los contadores del simulador actual y la numeración global.
+        self._fin = [0] * len(_COLAS)
+        self._base = [0] * len(_COLAS)
+        self._sim: Optional["Simulador"] = None
+
+    @property
+    def nombre(self) -> str:
+        """Nombre del bloque, para abrirlo con LectorFoto desde otro proceso."""
+        return self.shm.name
+
+    def _escribir_nuevos(self, sim: "Simulador") -> None:
+        """Escribe en los anillos las entradas encoladas desde el cuadro anterior."""
+        plan = sim.plan
+        if sim is not self._sim:
+            # Otro simulador (p. ej. tras Reiniciar): la numeración global sigue
+            # creciendo para no pisar ventanas que algún lector tenga en uso.
+            self._base = [fin - getattr(plan, bajas) for fin, (_, _, bajas, _, _) in zip(self._fin, _COLAS)]
+            self._sim = sim
+        cap = self.max_cola
+        for k, (atributo, altas, _, escrito, _) in enumerate(_COLAS):
+            cola = getattr(plan, atributo)
+            fin = self._base[k] + getattr(plan, altas)
+            nuevos = min(fin - self._fin[k], len(cola), cap)
+            if nuevos > 0:
+                self._cab[escrito] = fin  # antes de escribir: avisa qué posiciones se pisan
+                pos = np.arange(fin - nuevos, fin) % cap
+                anillo = self._anillos[k]
+                for campo in REGISTRO.names:
+                    valores = np.fromiter((getattr(p, campo) for p in islice(reversed(cola), nuevos)),
+                                          dtype=np.int64, count=nuevos)[::-1]
+                    anillo[campo][pos] = valores
+                    anillo[campo][pos + cap] = valores
+            self._fin[k] = fin
+
+    def publicar(self, sim: "Simulador") -> None:
+        self._escribir_nuevos(sim)
+        indice = 1 - int(self._cab[_CAB_ULTIMO])
+        esc = self._slots[indice]
+
+        esc[_I["seq"]] += 1  # impar: escribiendo
+        actual = sim.cpu.actual
+        esc[_I["tick"]] = sim.cpu.tiempo_total
+        esc[_I["capacidad_mb"]] = sim.memoria.capacidad_mb
+        esc[_I["usado_mb"]] = sim.memoria.usado_mb
+        esc[_I["pico_mb"]] = sim.memoria.pico_mb
+        esc[_I["cpu_pid"]] = -1 if actual is None else actual.pid
+        esc[_I["cpu_restante_s"]] = 0 if actual is None else actual.restante_s
+        esc[_I["n_listos"]] = len(sim.plan.listos)
+        esc[_I["n_espera"]] = len(sim.plan.espera_memoria)
+        esc[_I["n_finalizados"]] = len(sim.finalizados)
+        for k, (atributo, _, _, _, sufijo) in enumerate(_COLAS):
+            fin = self._fin[k]
+            ini = max(fin - len(getattr(sim.plan, atributo)), fin - self.max_cola)
+            esc[_I[f"ini_{sufijo}"]] = ini
+            esc[_I[f"pub_{sufijo}"]] = fin - ini
+        esc[_I["seq"]] += 1  # par: listo
+
+        self._cab[_CAB_ULTIMO] = indice
+        self._cab[_CAB_PUBLICADOS] += 1
+
+    def cerrar(self) -> None:
+        """Libera el bloque (los lectores abiertos dejan de recibir cuadros nuevos)."""
+        del self._cab, self._slots, self._anillos  # soltar las vistas antes de cerrar el buffer
+        self.shm.close()
+        self.shm.unlink()
+
+
+@dataclass
+class Cuadro:
+    """
+    Un cuadro publicado, como vistas NumPy directas sobre la memoria compartida (sin copia).
+    Validar con LectorFoto.vigente(cuadro) después de usarlo; si ya no es vigente,
+    el publicador lo sobrescribió y hay que descartar lo leído.
+    """
+
+    slot: int
+    seq: int
+    escalares: np.ndarray
+    listos: np.ndarray
+    espera: np.ndarray
+    ini_listos: int
+    ini_espera: int
+
+    def __getitem__(self, nombre: str) -> int:
+        return int(self.escalares[_I[nombre]])
+
+
+def _adjuntar(nombre: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=nombre, track=False)
+    # Antes de 3.13 el lector se registra en el resource_tracker, que borraría el bloque
+    # al salir el lector. Se evita el registro mientras se abre.
+    from multiprocessing import resource_tracker
+    registrar = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=nombre)
+    finally:
+        resource_tracker.register = registrar
+
+
+class LectorFoto:
+    """Lado del visor: abre por nombre el bloque de un PublicadorFoto y lee cuadros."""
+
+    def __init__(self, nombre: str) -> None:
+        self.shm = _adjuntar(nombre)
+        cab = np.ndarray((_CAB_LARGO,), dtype=np.int64, buffer=self.shm.buf)
+        if cab[_CAB_FIRMA] != _FIRMA:
+            raise CompartidaError(f"El bloque {nombre!r} no es una foto del simulador.")
+        self.max_cola = int(cab[_CAB_MAX_COLA])
+        self._cab, self._slots, self._anillos = _vistas(self.shm.buf, self.max_cola)
+
+    def _ventana(self, k: int, ini: int, n: int) -> np.ndarray:
+        a = ini % self.max_cola
+        return self._anillos[k][a:a + n]
+
+    def leer(self, intentos: int = 100) -> Optional[Cuadro]:
+        """
+        Último cuadro completo, como vistas (sin copia ni deserialización).
+        Devuelve None si el publicador todavía no publicó ningún cuadro.
+        """
+        for _ in range(intentos):
+            if not self._cab[_CAB_PUBLICADOS]:
+                return None
+            slot = int(self._cab[_CAB_ULTIMO])
+            esc = self._slots[slot]
+            seq = int(esc[_I["seq"]])
+            if seq % 2:
+                continue  # justo empezó a reescribirse: probamos con el nuevo último
+            ini_l, ini_e = int(esc[_I["ini_listos"]]), int(esc[_I["ini_espera"]])
+            cuadro = Cuadro(slot, seq, esc,
+                            self._ventana(0, ini_l, int(esc[_I["pub_listos"]])),
+                            self._ventana(1, ini_e, int(esc[_I["pub_espera"]])),
+                            ini_l, ini_e)
+            if self.vigente(cuadro):
+                return cuadro
+        raise CompartidaError("No se pudo leer un cuadro consistente (el publicador no para de escribir).")
+
+    def vigente(self, cuadro: Cuadro) -> bool:
+        """
+        ¿El cuadro sigue intacto? Su slot no se reescribió y ningún anillo avanzó
+        tanto como para pisar la ventana publicada (escrito <= ini + max_cola).
+        """
+        return (int(self._slots[cuadro.slot][_I["seq"]]) == cuadro.seq
+                and int(self._cab[_CAB_ESCRITO_LISTOS]) <= cuadro.ini_listos + self.max_cola
+                and int(self._cab[_CAB_ESCRITO_ESPERA]) <= cuadro.ini_espera + self.max_cola)
+
+    def copiar(self, intentos: int = 100) -> Optional[dict]:
+        """Cuadro consistente copiado a objetos propios (None si aún no hay cuadros)."""
+        for _ in range(intentos):
+            cuadro = self.leer(intentos)
+            if cuadro is None:
+                return None
+            foto = {nombre: cuadro[nombre] for nombre in ESCALARES if nombre != "seq"}
+            foto["listos"] = cuadro.listos.copy()
+            foto["espera_memoria"] = cuadro.espera.copy()
+            if self.vigente(cuadro):
+                return foto
+        raise CompartidaError("No se pudo copiar un cuadro consistente.")
+
+    def cerrar(self) -> None:
+        del self._cab, self._slots, self._anillos
+        self.shm.close()
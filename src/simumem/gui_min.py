@@ -7,6 +7,7 @@ from tkinter import ttk, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 
+from .mapa_memoria import VistaMapaMemoria
 from .simulador import Simulador
 from .proceso import Proceso
 
@@ -14,7 +15,7 @@ from .proceso import Proceso
 class VentanaSimulador(tk.Tk):
     """
     Interfaz mínima y sobria para observar el simulador:
-      - RAM: barra de uso + gráfica de % de uso en el tiempo.
+      - RAM: barra de uso + mapa de memoria (raster) + gráfica de % de uso en el tiempo.
       - Colas: LISTOS (FIFO) y Espera por memoria.
       - CPU: proceso actual y lista de finalizados.
       - Controles: Agregar aleatorio, Agregar manualmente, Paso, Iniciar/Pausar, Reiniciar.
@@ -66,6 +67,11 @@ class VentanaSimulador(tk.Tk):
         self.lbl_ram = ttk.Label(marco_ram, text="RAM: 0 / 0 MB", style="Muted.TLabel")
         self.lbl_ram.pack(anchor="e", pady=(6, 0))
 
+        # Mapa de memoria: cada asignación pintada como rango de direcciones
+        self.mapa_ram = VistaMapaMemoria(marco_ram, capacidad_mb=self.sim.memoria.capacidad_mb,
+                                         ancho=824, alto=24)
+        self.mapa_ram.pack(fill="x", pady=(6, 0))
+
         # Gráfica de % uso RAM
         graf = ttk.Frame(root)
         graf.pack(fill="x", pady=(0, 8))
@@ -191,6 +197,7 @@ class VentanaSimulador(tk.Tk):
             self.sim = Simulador(capacidad_mb=cap)
             self._reloj_corriendo = False
             self._hist_uso.clear()
+            self.mapa_ram.reiniciar(cap)
             self.btn_toggle.configure(text="Iniciar")
             self._actualizar_vista()
 
@@ -261,7 +268,9 @@ class VentanaSimulador(tk.Tk):
         disp = foto["ram"]["disponible_mb"]
         self.pb_ram["maximum"] = cap
         self.pb_ram["value"] = usado
-        self.lbl_ram.configure(text=f"RAM: {usado} / {cap} MB  —  Libre: {disp} MB")
+        pico = foto["ram"]["pico_mb"]
+        self.lbl_ram.configure(text=f"RAM: {usado} / {cap} MB  —  Libre: {disp} MB  —  Pico: {pico} MB")
+        self.mapa_ram.actualizar(foto["ram"]["pids"], foto["cpu"]["pid"])
 
         # Actualizar histograma de % uso RAM
         porcentaje = 0 if cap == 0 else (usado / cap) * 100.0
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import colorsys
+import tkinter as tk
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from tkinter import ttk
+
+
+# Colores base del mapa (RGB). Van en sintonía con el tema oscuro de la GUI.
+COLOR_LIBRE = (30, 30, 30)
+COLOR_LISTO = (70, 130, 180)
+COLOR_EJECUTANDO = (220, 60, 60)
+
+
+def _paleta_pids(cantidad: int = 64) -> np.ndarray:
+    """Paleta fija para colorear por PID (tono con paso áureo, todos distinguibles)."""
+    colores = []
+    for i in range(cantidad):
+        h = (i * 0.618033988749895) % 1.0
+        r, g, b = colorsys.hsv_to_rgb(h, 0.55, 0.9)
+        colores.append((int(r * 255), int(g * 255), int(b * 255)))
+    return np.array(colores, dtype=np.uint8)
+
+
+class MapaMemoria:
+    """
+    Mapa rasterizado de la RAM, pintado en un buffer NumPy (alto x ancho x RGB).
+
+    - La memoria del simulador no tiene direcciones (solo MB por PID), así que
+      aquí se les asigna un rango [inicio, fin) en MB con primer ajuste. Si ningún
+      hueco alcanza pero el total libre sí, se compacta (igual que el modelo
+      "sin fragmentación" de MemoriaRAM) y se repinta todo.
+    - El espacio de direcciones se recorre por filas: el píxel i cubre
+      las direcciones [i*cap/P, (i+1)*cap/P), con P = ancho*alto.
+    - Solo se repintan las regiones sucias (asignaciones que entraron, salieron
+      o cambiaron de color); el repintado completo es vectorizado.
+    """
+
+    MODOS = ("pid", "estado")
+
+    def __init__(self, capacidad_mb: int, ancho: int = 512, alto: int = 32, modo: str = "pid") -> None:
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo de color desconocido: {modo!r}")
+        self.ancho = ancho
+        self.alto = alto
+        self.modo = modo
+        self.buffer = np.empty((alto, ancho, 3), dtype=np.uint8)
+        self._paleta = _paleta_pids()
+        self.reiniciar(capacidad_mb)
+
+    # --------------- Estado del layout ---------------
+
+    def reiniciar(self, capacidad_mb: int) -> None:
+        """Vacía el mapa (p. ej. al reiniciar el simulador)."""
+        self.capacidad_mb = capacidad_mb
+        self._inicio: Dict[int, int] = {}
+        self._tam: Dict[int, int] = {}
+        # Inicios ocupados ordenados (y a qué PID pertenecen) para ubicar regiones sucias.
+        self._ocupados: List[int] = []
+        self._pid_en: Dict[int, int] = {}
+        # Huecos libres ordenados por inicio: lista de inicios + tamaño por inicio.
+        self._huecos: List[int] = [0] if capacidad_mb > 0 else []
+        self._hueco_tam: Dict[int, int] = {0: capacidad_mb} if capacidad_mb > 0 else {}
+        self._pid_cpu: Optional[int] = None
+        self._sucias: List[Tuple[int, int]] = []
+        self._todo_sucio = True
+
+    def cambiar_modo(self, modo: str) -> None:
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo de color desconocido: {modo!r}")
+        if modo != self.modo:
+            self.modo = modo
+            self._todo_sucio = True
+
+    def rango(self, pid: int) -> Optional[Tuple[int, int]]:
+        """Rango [inicio, fin) en MB asignado a 'pid' en el mapa (None si no está)."""
+        if pid not in self._inicio:
+            return None
+        ini = self._inicio[pid]
+        return ini, ini + self._tam[pid]
+
+    def sincronizar(self, asignaciones: Dict[int, int], pid_cpu: Optional[int] = None) -> None:
+        """
+        Alinea el mapa con las asignaciones actuales de la RAM (pid -> MB).
+        Solo marca como sucio lo que cambió respecto a la llamada anterior.
+        """
+        for pid in self._tam.keys() - asignaciones.keys():
+            self._quitar(pid)
+        for pid in asignaciones.keys() - self._tam.keys():
+            self._colocar(pid, asignaciones[pid])
+
+        if pid_cpu != self._pid_cpu:
+            viejo, self._pid_cpu = self._pid_cpu, pid_cpu
+            if self.modo == "estado":
+                for pid in (viejo, pid_cpu):
+                    if pid is not None and pid in self._inicio:
+                        self._marcar(pid)
+
+    def _colocar(self, pid: int, tam: int) -> None:
+        # Primer ajuste sobre los huecos (ordenados por dirección).
+        for ini in self._huecos:
+            libre = self._hueco_tam[ini]
+            if libre >= tam:
+                self._huecos.remove(ini)
+                del self._hueco_tam[ini]
+                if libre > tam:
+                    insort(self._huecos, ini + tam)
+                    self._hueco_tam[ini + tam] = libre - tam
+                self._ocupar(pid, ini, tam)
+                self._marcar(pid)
+                return
+        # No hay hueco contiguo: compactamos y dejamos el nuevo al final.
+        self._compactar()
+        ini = self._ocupados[-1] + self._tam[self._pid_en[self._ocupados[-1]]] if self._ocupados else 0
+        self._ocupar(pid, ini, tam)
+        resto = self.capacidad_mb - ini - tam
+        self._huecos = [ini + tam] if resto > 0 else []
+        self._hueco_tam = {ini + tam: resto} if resto > 0 else {}
+
+    def _ocupar(self, pid: int, ini: int, tam: int) -> None:
+        self._inicio[pid] = ini
+        self._tam[pid] = tam
+        insort(self._ocupados, ini)
+        self._pid_en[ini] = pid
+
+    def _quitar(self, pid: int) -> None:
+        self._marcar(pid)
+        ini = self._inicio.pop(pid)
+        tam = self._tam.pop(pid)
+        del self._ocupados[bisect_left(self._ocupados, ini)]
+        del self._pid_en[ini]
+        # Insertar el hueco y fusionarlo con los vecinos contiguos.
+        i = bisect_left(self._huecos, ini)
+        if i < len(self._huecos) and self._huecos[i] == ini + tam:
+            tam += self._hueco_tam.pop(self._huecos.pop(i))
+        if i > 0:
+            previo = self._huecos[i - 1]
+            if previo + self._hueco_tam[previo] == ini:
+                self._hueco_tam[previo] += tam
+                return
+        self._huecos.insert(i, ini)
+        self._hueco_tam[ini] = tam
+
+    def _compactar(self) -> None:
+        cursor = 0
+        pids = [self._pid_en[ini] for ini in self._ocupados]
+        self._ocupados, self._pid_en = [], {}
+        for pid in pids:
+            self._ocupados.append(cursor)
+            self._pid_en[cursor] = pid
+            self._inicio[pid] = cursor
+            cursor += self._tam[pid]
+        self._todo_sucio = True
+
+    # --------------- Raster ---------------
+
+    def _a_pixel(self, mb: int) -> int:
+        total = self.ancho * self.alto
+        return 0 if self.capacidad_mb <= 0 else mb * total // self.capacidad_mb
+
+    def _marcar(self, pid: int) -> None:
+        ini = self._inicio[pid]
+        self._sucias.append((self._a_pixel(ini), self._a_pixel(ini + self._tam[pid])))
+
+    def _color(self, pid: int) -> np.ndarray:
+        if self.modo == "estado":
+            return np.array(COLOR_EJECUTANDO if pid == self._pid_cpu else COLOR_LISTO, dtype=np.uint8)
+        return self._paleta[pid % len(self._paleta)]
+
+    def pintar(self) -> Optional[Tuple[int, int]]:
+        """
+        Aplica al buffer los cambios pendientes.
+        Devuelve el rango de filas [fila_ini, fila_fin) a refrescar, o None si no hay nada.
+        """
+        plano = self.buffer.reshape(-1, 3)
+        if self._todo_sucio:
+            self._pintar_todo(plano)
+            self._todo_sucio = False
+            self._sucias.clear()
+            return 0, self.alto
+        if not self._sucias:
+            return None
+
+        px_min, px_max = plano.shape[0], 0
+        for a, b in self._sucias:
+            px_min, px_max = min(px_min, a), max(px_max, b)
+            plano[a:b] = COLOR_LIBRE
+        # Repintar las asignaciones vivas que caen dentro de cada región sucia.
+        total = plano.shape[0]
+        for sa, sb in self._sucias:
+            i = max(bisect_left(self._ocupados, sa * self.capacidad_mb // total) - 1, 0)
+            while i < len(self._ocupados):
+                ini = self._ocupados[i]
+                pid = self._pid_en[ini]
+                a, b = self._a_pixel(ini), self._a_pixel(ini + self._tam[pid])
+                if a >= sb:
+                    break
+                if b > sa:
+                    plano[a:b] = self._color(pid)
+                i += 1
+        self._sucias.clear()
+        if px_max <= px_min:
+            return None
+        return px_min // self.ancho, -(-px_max // self.ancho)
+
+    def _pintar_todo(self, plano: np.ndarray) -> None:
+        total = plano.shape[0]
+        if not self._inicio:
+            plano[:] = COLOR_LIBRE
+            return
+        pids = np.fromiter(self._inicio.keys(), dtype=np.int64, count=len(self._inicio))
+        inicios = np.fromiter(self._inicio.values(), dtype=np.int64, count=len(pids))
+        tams = np.fromiter((self._tam[p] for p in self._inicio), dtype=np.int64, count=len(pids))
+        orden = np.argsort(inicios)
+        pids, inicios, tams = pids[orden], inicios[orden], tams[orden]
+
+        a = inicios * total // self.capacidad_mb
+        b = (inicios + tams) * total // self.capacidad_mb
+        # Secuencia intercalada hueco, asignación, hueco, ... cubriendo todos los píxeles.
+        bordes = np.empty(2 * len(a) + 2, dtype=np.int64)
+        bordes[0], bordes[-1] = 0, total
+        bordes[1:-1:2], bordes[2:-1:2] = a, b
+        largos = np.diff(bordes)
+        etiquetas = np.zeros(len(largos), dtype=np.int64)
+        etiquetas[1::2] = np.arange(1, len(a) + 1)
+
+        if self.modo == "estado":
+            colores = np.empty((len(a), 3), dtype=np.uint8)
+            colores[:] = COLOR_LISTO
+            colores[pids == (self._pid_cpu if self._pid_cpu is not None else -1)] = COLOR_EJECUTANDO
+        else:
+            colores = self._paleta[pids % len(self._paleta)]
+        tabla = np.vstack([np.array(COLOR_LIBRE, dtype=np.uint8), colores])
+        plano[:] = tabla[np.repeat(etiquetas, largos)]
+
+    def ppm(self, fila_ini: int = 0, fila_fin: Optional[int] = None) -> bytes:
+        """Filas [fila_ini, fila_fin) del buffer como PPM binario (lo que entiende Tk)."""
+        filas = self.buffer[fila_ini:fila_fin]
+        cabecera = f"P6 {self.ancho} {filas.shape[0]} 255 ".encode("ascii")
+        return cabecera + filas.tobytes()
+
+
+class VistaMapaMemoria(ttk.Frame):
+    """
+    Panel Tk del mapa de memoria. Todo el dibujo ocurre en NumPy (MapaMemoria);
+    aquí solo se empuja la banda de filas modificada a un PhotoImage con un único 'put'.
+    """
+
+    def __init__(self, parent, capacidad_mb: int, ancho: int = 512, alto: int = 32) -> None:
+        super().__init__(parent)
+        self.mapa = MapaMemoria(capacidad_mb, ancho=ancho, alto=alto)
+        self._img = tk.PhotoImage(width=ancho, height=alto)
+
+        cabecera = ttk.Frame(self)
+        cabecera.pack(fill="x")
+        ttk.Label(cabecera, text="Mapa de memoria", style="Muted.TLabel").pack(side="left")
+        self._modo = tk.StringVar(value=self.mapa.modo)
+        selector = ttk.Combobox(cabecera, textvariable=self._modo, values=MapaMemoria.MODOS,
+                                state="readonly", width=8)
+        selector.pack(side="right")
+        selector.bind("<<ComboboxSelected>>", lambda _e: self._cambiar_modo())
+        ttk.Label(cabecera, text="Color:", style="Muted.TLabel").pack(side="right", padx=(0, 4))
+
+        self._lienzo = ttk.Label(self, image=self._img, borderwidth=0)
+        self._lienzo.pack(anchor="w", pady=(4, 0))
+
+    def actualizar(self, asignaciones: Dict[int, int], pid_cpu: Optional[int] = None) -> None:
+        self.mapa.sincronizar(asignaciones, pid_cpu)
+        self._refrescar()
+
+    def _refrescar(self) -> None:
+        filas = self.mapa.pintar()
+        if filas is None:
+            return
+        fila_ini, fila_fin = filas
+        self._img.tk.call(self._img, "put", self.mapa.ppm(fila_ini, fila_fin),
+                          "-format", "ppm", "-to", 0, fila_ini)
+
+    def reiniciar(self, capacidad_mb: int) -> None:
+        self.mapa.reiniciar(capacidad_mb)
+
+    def _cambiar_modo(self) -> None:
+        self.mapa.cambiar_modo(self._modo.get())
+        self._refrescar()
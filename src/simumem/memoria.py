@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Callable, Dict, Tuple
 
 class MemoriaError(Exception):
     """Errores relacionados con la administración de memoria."""
@@ -11,21 +11,45 @@ class MemoriaRAM:
     """
     Administrador muy directo de memoria.
     - Trabajamos en MB y sin fragmentación (modelo simple y suficiente para el curso).
-    - Lleva un registro por PID de lo reservado.
+    - Lleva un registro por PID de lo reservado y el total usado al día
+      (O(1) por consulta). Con debug=True se verifica el total tras cada cambio.
+    - Estadísticas: pico de uso y promedio ponderado por tiempo (ver tictac()).
+    - Umbrales: suscribir() avisa cuando el uso cruza un nivel (alto o bajo),
+      así el planificador puede reaccionar sin consultar en cada tick.
     """
 
     capacidad_mb: int = 1024  # 1 GB por defecto
+    debug: bool = False
     _asignaciones: Dict[int, int] = field(default_factory=dict, init=False)
+    _usado: int = field(default=0, init=False)
+    _pico: int = field(default=0, init=False)
+    _integral: int = field(default=0, init=False)  # MB·s acumulados
+    _tiempo: int = field(default=0, init=False)
+    # id de suscripción -> (umbral_mb, sube, callback): sube=True avisa al alcanzar
+    # el umbral, sube=False al bajar de él.
+    _umbrales: Dict[int, Tuple[int, bool, Callable[["MemoriaRAM"], None]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _sig_suscripcion: int = field(default=1, init=False, repr=False, compare=False)
 
     # --------------- Lecturas útiles ---------------
 
     @property
     def usado_mb(self) -> int:
-        return sum(self._asignaciones.values())
+        return self._usado
 
     @property
     def disponible_mb(self) -> int:
-        return self.capacidad_mb - self.usado_mb
+        return self.capacidad_mb - self._usado
+
+    @property
+    def pico_mb(self) -> int:
+        """Máximo uso observado desde que se creó la memoria."""
+        return self._pico
+
+    @property
+    def promedio_mb(self) -> float:
+        """Uso promedio ponderado por tiempo (según los tictac() recibidos)."""
+        return self._integral / self._tiempo if self._tiempo else float(self._usado)
 
     # --------------- Operaciones principales ---------------
 
@@ -45,6 +69,7 @@ class MemoriaRAM:
 
         if pedido_mb <= self.disponible_mb:
             self._asignaciones[pid] = pedido_mb
+            self._cambiar_uso(pedido_mb)
             return True
         return False
 
@@ -53,7 +78,56 @@ class MemoriaRAM:
         Libera la memoria asociada a 'pid'. Devuelve la cantidad liberada (MB).
         Si el PID no existe, devuelve 0 (idempotente para simplificar flujo).
         """
-        return self._asignaciones.pop(pid, 0)
+        liberado = self._asignaciones.pop(pid, 0)
+        if liberado:
+            self._cambiar_uso(-liberado)
+        return liberado
+
+    def tictac(self, delta_s: int = 1) -> None:
+        """Acumula el uso actual durante 'delta_s' segundos (para el promedio)."""
+        self._integral += self._usado * delta_s
+        self._tiempo += delta_s
+
+    # --------------- Umbrales (eventos de presión) ---------------
+
+    def suscribir(self, umbral_mb: int, callback: Callable[["MemoriaRAM"], None], sube: bool = True) -> int:
+        """
+        Registra un aviso de presión de memoria:
+          - sube=True  (marca alta): se llama cuando el uso pasa de < umbral a >= umbral.
+          - sube=False (marca baja): se llama cuando el uso pasa de >= umbral a < umbral.
+        Devuelve un identificador único (aunque se repita umbral y callback)
+        para cancelar_suscripcion().
+        """
+        if not 0 < umbral_mb <= self.capacidad_mb:
+            raise MemoriaError("El umbral debe estar entre 1 y la capacidad (MB).")
+        sub = self._sig_suscripcion
+        self._sig_suscripcion += 1
+        self._umbrales[sub] = (umbral_mb, sube, callback)
+        return sub
+
+    def cancelar_suscripcion(self, sub: int) -> None:
+        self._umbrales.pop(sub, None)  # si ya estaba cancelada, no pasa nada
+
+    def _cambiar_uso(self, delta_mb: int) -> None:
+        antes = self._usado
+        self._usado = ahora = antes + delta_mb
+        if ahora > self._pico:
+            self._pico = ahora
+        if self.debug:
+            self.verificar()
+        for umbral, sube, callback in list(self._umbrales.values()):
+            if sube and antes < umbral <= ahora:
+                callback(self)
+            elif not sube and ahora < umbral <= antes:
+                callback(self)
+
+    def verificar(self) -> None:
+        """Chequeo de consistencia del total acumulado (modo debug)."""
+        real = sum(self._asignaciones.values())
+        if real != self._usado:
+            raise MemoriaError(f"Total inconsistente: acumulado {self._usado} MB, real {real} MB.")
+        if not 0 <= self._usado <= self.capacidad_mb:
+            raise MemoriaError(f"Uso fuera de rango: {self._usado} MB de {self.capacidad_mb} MB.")
 
     # --------------- Utilidades ---------------
 
@@ -63,5 +137,7 @@ class MemoriaRAM:
             "capacidad_mb": self.capacidad_mb,
             "usado_mb": self.usado_mb,
             "disponible_mb": self.disponible_mb,
+            "pico_mb": self._pico,
+            "promedio_mb": self.promedio_mb,
             "pids": dict(self._asignaciones),  # copia para no exponer el interno
         }
@@ -24,6 +24,13 @@ class PlanificadorFIFO:
         self.memoria = memoria
         self.espera_memoria: Deque[Proceso] = deque()
         self.listos: Deque[Proceso] = deque()
+        # Contadores monótonos de entradas/salidas de cada cola. Con ellos, quien
+        # refleje las colas afuera (p. ej. compartida.PublicadorFoto) sabe qué cambió
+        # sin recorrerlas: la cola contiene las entradas número [bajas, altas).
+        self.altas_listos = 0
+        self.bajas_listos = 0
+        self.altas_espera = 0
+        self.bajas_espera = 0
 
     # --------- Altas y movimientos ---------
 
@@ -33,8 +40,10 @@ class PlanificadorFIFO:
             self.memoria.reservar(p.pid, p.memoria_mb)
             p.admitir()
             self.listos.append(p)
+            self.altas_listos += 1
         else:
             self.espera_memoria.append(p)
+            self.altas_espera += 1
 
     def intentar_admitir_espera(self) -> None:
         """
@@ -47,6 +56,7 @@ class PlanificadorFIFO:
             candidato = self.espera_memoria[0]
             if self.memoria.puede_reservar(candidato.memoria_mb):
                 self.espera_memoria.popleft()
+                self.bajas_espera += 1
                 self.memoria.reservar(candidato.pid, candidato.memoria_mb)
                 candidato.admitir()
                 mover.append(candidato)
@@ -54,10 +64,14 @@ class PlanificadorFIFO:
                 break
         # Encolamos los que sí cupieron
         self.listos.extend(mover)
+        self.altas_listos += len(mover)
 
     def tomar_siguiente(self) -> Optional[Proceso]:
         """Entrega el siguiente proceso LISTO (FIFO)."""
-        return self.listos.popleft() if self.listos else None
+        if not self.listos:
+            return None
+        self.bajas_listos += 1
+        return self.listos.popleft()
 
     # --------- Consultas útiles ---------
 
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .simulador import Simulador
+
+
+COLUMNAS = ("tick", "ram_usado_mb", "listos", "espera_memoria", "cpu_ocupada", "completados")
+FORMATOS = ("npy", "npz", "csv")
+
+
+class SeriesError(Exception):
+    """Errores del registro de series de tiempo."""
+
+
+class RegistroSeries:
+    """
+    Registro columnar de métricas por tick, pensado para corridas muy largas.
+
+    - Cada tick se escribe en un bloque NumPy preasignado (bloque x columnas).
+    - Cuando el bloque se llena, se vuelca entero a disco y se reutiliza:
+        npy -> un archivo por bloque (matriz 2D, columnas en el orden de COLUMNAS)
+        npz -> un archivo por bloque con una entrada por columna
+        csv -> un único archivo al que se le agregan los bloques
+    - 'cada' permite submuestrear: se guarda 1 fila cada N ticks. Los medidores
+      (RAM, colas) se toman del último tick de la ventana; 'cpu_ocupada' y
+      'completados' suman lo ocurrido en toda la ventana (ticks con CPU ocupada y
+      finalizaciones), así no dependen solo del último tick.
+
+    Uso típico: Simulador(registro=RegistroSeries("salida/")) y al final registro.cerrar().
+    Si el directorio ya tiene series con el mismo prefijo se rechaza, salvo con
+    sobrescribir=True (se borran antes de empezar, para no mezclar corridas).
+    """
+
+    def __init__(self, directorio: str, formato: str = "npy", bloque: int = 65536,
+                 cada: int = 1, prefijo: str = "series", sobrescribir: bool = False) -> None:
+        if formato not in FORMATOS:
+            raise SeriesError(f"Formato desconocido: {formato!r} (use {', '.join(FORMATOS)}).")
+        if bloque <= 0 or cada <= 0:
+            raise SeriesError("'bloque' y 'cada' deben ser > 0.")
+        self.directorio = directorio
+        self.formato = formato
+        self.cada = cada
+        self.prefijo = prefijo
+        self._buffer = np.zeros((bloque, len(COLUMNAS)), dtype=np.int64)
+        self._fila = 0
+        self._bloques_escritos = 0
+        self._ticks = 0
+        self._completados_ventana = 0
+        self._ocupada_ventana = 0
+        self._finalizados_previos = 0
+        self._sim: Optional["Simulador"] = None
+        os.makedirs(directorio, exist_ok=True)
+
+        previos = _archivos_series(directorio, prefijo)
+        if previos and not sobrescribir:
+            raise SeriesError(f"Ya hay series '{prefijo}' en {directorio!r} (use sobrescribir=True).")
+        for nombre in previos:
+            os.remove(os.path.join(directorio, nombre))
+
+    # --------------- Registro ---------------
+
+    def anotar(self, sim: "Simulador", cpu_ocupada: bool) -> None:
+        """
+        Toma las métricas del simulador tras un paso(). 'cpu_ocupada' indica si la CPU
+        trabajó durante ese tick (medido antes del tick: al terminar, el proceso ya salió).
+        """
+        self._ocupada_ventana += cpu_ocupada
+        total_fin = len(sim.finalizados)
+        self._completados_ventana += total_fin - self._finalizados_previos
+        self._finalizados_previos = total_fin
+        self._ticks += 1
+        self._sim = sim
+        if self._ticks % self.cada == 0:
+            self._escribir_fila(sim)
+
+    def _escribir_fila(self, sim: "Simulador") -> None:
+        self._buffer[self._fila] = (
+            sim.cpu.tiempo_total,
+            sim.memoria.usado_mb,
+            len(sim.plan.listos),
+            len(sim.plan.espera_memoria),
+            self._ocupada_ventana,
+            self._completados_ventana,
+        )
+        self._ocupada_ventana = 0
+        self._completados_ventana = 0
+        self._fila += 1
+        if self._fila == len(self._buffer):
+            self.volcar()
+
+    def volcar(self) -> None:
+        """Escribe a disco las filas pendientes del bloque actual."""
+        if self._fila == 0:
+            return
+        datos = self._buffer[:self._fila]
+        if self.formato == "csv":
+            ruta = os.path.join(self.directorio, f"{self.prefijo}.csv")
+            nuevo = not os.path.exists(ruta)
+            with open(ruta, "a", encoding="utf-8") as f:
+                np.savetxt(f, datos, fmt="%d", delimiter=",",
+                           header=",".join(COLUMNAS) if nuevo else "", comments="")
+        else:
+            ruta = os.path.join(self.directorio, f"{self.prefijo}_{self._bloques_escritos:06d}.{self.formato}")
+            if self.formato == "npy":
+                np.save(ruta, datos)
+            else:
+                np.savez(ruta, **{c: datos[:, i] for i, c in enumerate(COLUMNAS)})
+        self._bloques_escritos += 1
+        self._fila = 0
+
+    def cerrar(self) -> None:
+        """
+        Vuelca lo que quede en memoria. Llamar al terminar la corrida.
+        Si la última ventana de submuestreo quedó incompleta, se cierra con una fila extra.
+        """
+        if self._sim is not None and self._ticks % self.cada:
+            self._escribir_fila(self._sim)
+        self._sim = None
+        self.volcar()
+
+
+def _archivos_series(directorio: str, prefijo: str) -> List[str]:
+    """Archivos de series de 'prefijo' en el directorio: el CSV y/o los bloques, ordenados."""
+    patron = re.compile(re.escape(prefijo) + r"(\.csv|_\d+\.(npy|npz))")
+    return sorted(a for a in os.listdir(directorio) if patron.fullmatch(a))
+
+
+def cargar_series(directorio: str, prefijo: str = "series") -> Dict[str, np.ndarray]:
+    """Reúne en memoria todos los bloques escritos por RegistroSeries (columna -> arreglo)."""
+    archivos = _archivos_series(directorio, prefijo)
+    ruta_csv = f"{prefijo}.csv"
+    if ruta_csv in archivos:
+        if len(archivos) > 1:
+            raise SeriesError(f"Hay series '{prefijo}' en CSV y en bloques en {directorio!r}: son corridas distintas.")
+        datos = np.loadtxt(os.path.join(directorio, ruta_csv), dtype=np.int64,
+                           delimiter=",", skiprows=1, ndmin=2)
+        return {c: datos[:, i] for i, c in enumerate(COLUMNAS)}
+
+    partes: List[np.ndarray] = []
+    for nombre in archivos:
+        ruta = os.path.join(directorio, nombre)
+        if nombre.endswith(".npy"):
+            partes.append(np.load(ruta))
+        else:
+            with np.load(ruta) as npz:
+                partes.append(np.column_stack([npz[c] for c in COLUMNAS]))
+    if not partes:
+        raise SeriesError(f"No hay series '{prefijo}' en {directorio!r}.")
+    datos = np.concatenate(partes)
+    return {c: datos[:, i] for i, c in enumerate(COLUMNAS)}
+
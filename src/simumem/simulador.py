@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-from typing import List, Optional, Iterable
+from typing import TYPE_CHECKING, List, Optional, Iterable
 
 from .memoria import MemoriaRAM
 from .planificador import PlanificadorFIFO
 from .cpu import CPUUnica
 from .proceso import Proceso
 
+if TYPE_CHECKING:
+    from .series import RegistroSeries
+
+
+# Versión de la lógica del motor. Subirla cuando cambie el resultado de una
+# corrida (invalida los resultados guardados por cache.CacheResultados).
+VERSION_MOTOR = "1"
+POLITICA = "FIFO"
+
 
 class Simulador:
     """
@@ -17,11 +26,12 @@ class Simulador:
         e intenta admitir procesos de la cola de espera.
     """
 
-    def __init__(self, capacidad_mb: int = 1024) -> None:
+    def __init__(self, capacidad_mb: int = 1024, registro: Optional["RegistroSeries"] = None) -> None:
         self.memoria = MemoriaRAM(capacidad_mb)
         self.plan = PlanificadorFIFO(self.memoria)
         self.cpu = CPUUnica()
         self.finalizados: List[Proceso] = []
+        self.registro = registro  # opcional: series de tiempo por tick (ver series.py)
 
     # --------- Altas ---------
 
@@ -38,9 +48,11 @@ class Simulador:
         """
         Ejecuta un 'paso' de simulación (1 segundo):
           1) Si la CPU está libre, toma el siguiente LISTO.
-          2) Avanza CPU 1s.
+          2) Avanza CPU 1s (y la RAM acumula su uso para el promedio).
           3) Si alguien terminó, libera memoria y registra finalizado.
-          4) Intenta admitir procesos en espera de memoria.
+          4) Solo si se liberó memoria, intenta admitir procesos en espera
+             (es el único evento que puede hacer que alguno quepa).
+          5) Si hay registro de series, anota las métricas del tick.
         """
         # 1) Despacho si corresponde
         if self.cpu.ociosa():
@@ -48,7 +60,9 @@ class Simulador:
             if siguiente is not None:
                 self.cpu.cargar(siguiente)
 
-        # 2) Avance de CPU
+        # 2) Avance de CPU (ocupada se mide antes: tick() suelta al que termina)
+        self.memoria.tictac(1)
+        cpu_ocupada = not self.cpu.ociosa()
         terminado = self.cpu.tick()
 
         # 3) Postproceso del que terminó
@@ -56,8 +70,12 @@ class Simulador:
             self.memoria.liberar(terminado.pid)
             self.finalizados.append(terminado)
 
-        # 4) Intentar admitir procesos que esperaban RAM
-        self.plan.intentar_admitir_espera()
+            # 4) Intentar admitir procesos que esperaban RAM
+            self.plan.intentar_admitir_espera()
+
+        # 5) Series de tiempo (opcional)
+        if self.registro is not None:
+            self.registro.anotar(self, cpu_ocupada)
 
     def corriendo(self) -> bool:
         """¿Sigue habiendo trabajo por hacer?"""